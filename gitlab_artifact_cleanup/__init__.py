@@ -1,7 +1,11 @@
 """The package init module makes convenience imports available for API users."""
 
+from typing import TYPE_CHECKING, Any
+
 from ._version import __version__, __version_info__
-from .artifact_cleanup import Gitlab
+
+if TYPE_CHECKING:
+    from .artifact_cleanup import Gitlab
 
 __author__ = "Ingo Meyer"
 __email__ = "i.meyer@fz-juelich.de"
@@ -17,3 +21,18 @@ __all__ = (
     "__version__",
     "__version_info__",
 )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the `Gitlab` class on first access, since importing python-gitlab slows down the command line interface.
+
+    :param name: The name of the module attribute
+    :return: The module attribute
+    :raises AttributeError: Is raised if the module has no attribute with the given name
+    """
+    if name == "Gitlab":
+        from .artifact_cleanup import Gitlab
+
+        return Gitlab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
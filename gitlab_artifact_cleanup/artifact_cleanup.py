@@ -1,22 +1,305 @@
 """A module to delete old artifacts from GitLab CI/CD jobs."""
 
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, Optional, Union
+from functools import cache, lru_cache
+from itertools import compress, count, islice
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
 
 from gitlab import Gitlab as _Gitlab
-from gitlab.exceptions import GitlabGetError
+from gitlab.exceptions import GitlabDeleteError, GitlabGetError, GitlabHttpError, GitlabJobEraseError, GitlabListError
+from gitlab.v4.objects import Project as GitlabProject
+from gitlab.v4.objects import ProjectBranchManager
 from gitlab.v4.objects import ProjectJob as GitlabProjectJob
+from gitlab.v4.objects import ProjectTagManager
+from requests import Response
+from requests.adapters import HTTPAdapter
 
 from .util import human_size
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+__all__ = ("Gitlab", "ProjectGetError")
+
 logger = logging.getLogger(__name__)
 
+LIST_PAGE_SIZE = 100
+# Only finished jobs can have artifacts or logs attached
+FINISHED_JOB_SCOPES = ["success", "failed", "canceled"]
+# Status codes with which GitLab rejects keyset pagination for a listing
+KEYSET_PAGINATION_UNSUPPORTED_STATUS_CODES = (400, 405)
+MAX_CONCURRENT_PROJECTS = 4
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 class ProjectGetError(Exception):
     """An error which is raised if a GitLab project could not be found."""
 
 
+def _decode_json_with_orjson(response: Response, *args: Any, **kwargs: Any) -> None:
+    """
+    Replace the JSON decoder of a response with `orjson.loads`, which parses job listings considerably faster.
+
+    This function is meant to be used as a response hook of a `requests.Session`.
+
+    :param response: The response whose JSON decoder is replaced
+    """
+    setattr(response, "json", lambda **kwargs: orjson.loads(response.content))
+
+
+class _LazyHumanSize:
+    """A size which is only converted to a human readable string when a log record is actually formatted."""
+
+    def __init__(self, size_in_bytes: int):
+        """
+        Initialize a lazily formatted size.
+
+        :param size_in_bytes: The size in bytes
+        """
+        self._size_in_bytes = size_in_bytes
+
+    def __str__(self) -> str:
+        """Return the size in a human readable format."""
+        return human_size(self._size_in_bytes)
+
+
+@lru_cache(maxsize=4096)
+def _iso_to_local_str(iso_timestamp: str) -> str:
+    """
+    Convert an ISO 8601 timestamp to a string in the local timezone.
+
+    Jobs which are created by the same pipeline share their timestamps, so the results are cached.
+
+    :param iso_timestamp: The timestamp in ISO 8601 format
+    :return: The timestamp in the local timezone, formatted as "YYYY-mm-dd HH:MM:SS"
+    """
+    return datetime.fromisoformat(iso_timestamp).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_job_description(
+    project: GitlabProject,
+    job: GitlabProjectJob,
+    job_created_at_localtime: str,
+    artifacts_size: int,
+    job_branch: Optional[str],
+    job_tag: Optional[str],
+) -> str:
+    """
+    Format a human readable description of a job for log messages.
+
+    The project is part of the description, since several projects are cleaned up concurrently.
+
+    :param project: The project the job belongs to
+    :param job: The job to describe
+    :param job_created_at_localtime: The creation time of the job, formatted in the local timezone
+    :param artifacts_size: The size of the artifacts which are attached to the job
+    :param job_branch: The branch if the job belongs to the latest commit of it, otherwise `None`
+    :param job_tag: The tag if the job belongs to it, otherwise `None`
+    :return: The job description
+    """
+    description = (
+        f'job "{job.id}" of project "{project.path_with_namespace}", created at'
+        f' "{job_created_at_localtime}", size "{human_size(artifacts_size)}"'
+    )
+    if job_branch is not None and job_tag is not None:
+        description += f', linked to branch "{job_branch}" and tag "{job_tag}"'
+    elif job_branch is not None:
+        description += f', linked to branch "{job_branch}"'
+    elif job_tag is not None:
+        description += f', linked to tag "{job_tag}"'
+    else:
+        description += ", dangling"
+    return description
+
+
+def _bounded_as_completed(
+    executor: Executor, fn: Callable[[_T], _R], items: Iterable[_T], max_pending: int
+) -> Iterator["Future[_R]"]:
+    """
+    Submit `fn(item)` for every item to an executor and yield the futures as they complete.
+
+    In contrast to `concurrent.futures.as_completed`, items are consumed lazily: A new item is only submitted when less
+    than `max_pending` futures are in flight, so the memory usage stays bounded for arbitrarily long item iterables.
+
+    :param executor: The executor to submit to
+    :param fn: The function which is called with every item
+    :param items: The items to process
+    :param max_pending: The maximum number of futures which are in flight at the same time
+    :return: An iterator over the completed futures
+    """
+    pending: set[Future[_R]] = set()
+    for item in items:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from done
+        pending.add(executor.submit(fn, item))
+    yield from as_completed(pending)
+
+
+def _prefetch_pages(items: Iterable[_T], page_size: int) -> Iterator[list[_T]]:
+    """
+    Split items into pages and fetch the next page in a background thread while the current one is processed.
+
+    This is useful for lazily paginated API listings: The request for the next page overlaps with the processing of the
+    current page.
+
+    :param items: The items to split into pages
+    :param page_size: The number of items per page
+    :return: An iterator over the pages
+    """
+    iterator = iter(items)
+
+    def next_page() -> list[_T]:
+        return list(islice(iterator, page_size))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page_future = executor.submit(next_page)
+        while page := page_future.result():
+            page_future = executor.submit(next_page)
+            yield page
+
+
+def _list_ref_tips(ref_manager: Union[ProjectBranchManager, ProjectTagManager]) -> frozenset[tuple[str, str]]:
+    """
+    List the tips of all branches or tags of a project.
+
+    The tips are returned as a set of `(ref, commit hash)` pairs, so a job can be checked with a single lookup.
+
+    :param ref_manager: The branch or tag manager of a project
+    :return: The set of all tips
+    """
+    return frozenset((ref.name, ref.commit["id"]) for ref in ref_manager.list(iterator=True, per_page=LIST_PAGE_SIZE))
+
+
+def _get_jobs_page(project: GitlabProject, page: int, per_page: int) -> list[dict[str, Any]]:
+    """
+    Get one page of the finished jobs of a project, newest first, as raw dictionaries.
+
+    :param project: The project whose jobs are requested
+    :param page: The page number
+    :param per_page: The number of jobs per page
+    :return: The jobs of the requested page, an empty list if the page is beyond the end of the listing
+    :raises GitlabListError: Is raised if the jobs cannot be listed
+    """
+    try:
+        jobs = project.manager.gitlab.http_list(
+            project.jobs.path, query_data={"scope[]": FINISHED_JOB_SCOPES}, page=page, per_page=per_page
+        )
+    except GitlabHttpError as e:
+        raise GitlabListError(e.error_message, e.response_code, e.response_body) from e
+    assert isinstance(jobs, list)
+    return jobs
+
+
+def _find_first_page_with_old_jobs(project: GitlabProject, is_old: Callable[[str], bool]) -> int:
+    """
+    Find the first page of the job listing (newest first, `LIST_PAGE_SIZE` jobs per page) which contains old jobs.
+
+    Each probe only requests the last job of a page. Page numbers are doubled until a page with old jobs is found, then
+    the first such page is located with a binary search. This needs `O(log n)` small requests instead of paging through
+    all young jobs of a project.
+
+    :param project: The project whose jobs are searched
+    :param is_old: A predicate which decides by the creation timestamp if a job is old
+    :return: The first page which contains old jobs, or a page beyond the end of the listing if all jobs are young
+    """
+
+    def page_has_old_jobs(page: int) -> bool:
+        jobs = _get_jobs_page(project, page * LIST_PAGE_SIZE, per_page=1)
+        # An empty result means that the page is beyond the end of the listing
+        return not jobs or is_old(jobs[0]["created_at"])
+
+    if page_has_old_jobs(1):
+        return 1
+    young_page, old_page = 1, 2
+    while not page_has_old_jobs(old_page):
+        young_page, old_page = old_page, 2 * old_page
+    while old_page - young_page > 1:
+        middle_page = (young_page + old_page) // 2
+        if page_has_old_jobs(middle_page):
+            old_page = middle_page
+        else:
+            young_page = middle_page
+    return old_page
+
+
+def _list_jobs(project: GitlabProject, is_old: Callable[[str], bool]) -> Iterable[dict[str, Any]]:
+    """
+    List the finished jobs of a project, newest first, as raw dictionaries.
+
+    The raw dictionaries are returned instead of `ProjectJob` objects, since most jobs are filtered out and wrapping
+    them would be wasted work.
+
+    Keyset pagination is used if the GitLab server supports it, since it does not slow down for deep pages like offset
+    pagination does. GitLab only supports keyset pagination of jobs when they are ordered by descending ids, which is
+    also the default order of the offset based job listing. Keyset pagination always starts with the newest jobs, so
+    the caller must still filter out young jobs. Offset pagination starts at the first page which contains old jobs
+    instead.
+
+    :param project: The project whose jobs are listed
+    :param is_old: A predicate which decides by the creation timestamp if a job is old
+    :return: An iterable over the jobs of the project, which may include young jobs
+    :raises GitlabListError: Is raised if the jobs cannot be listed
+    """
+    try:
+        jobs = project.manager.gitlab.http_list(
+            project.jobs.path,
+            query_data={"scope[]": FINISHED_JOB_SCOPES},
+            iterator=True,
+            pagination="keyset",
+            order_by="id",
+            sort="desc",
+            per_page=LIST_PAGE_SIZE,
+        )
+    except GitlabHttpError as e:
+        if e.response_code not in KEYSET_PAGINATION_UNSUPPORTED_STATUS_CODES:
+            raise GitlabListError(e.error_message, e.response_code, e.response_body) from e
+        logger.debug("Keyset pagination of jobs is not supported (%s), falling back to offset pagination", e)
+        return _list_jobs_from_page(project, _find_first_page_with_old_jobs(project, is_old))
+    return _iterate_listing(jobs)
+
+
+def _iterate_listing(items: Iterable[_T]) -> Iterator[_T]:
+    """
+    Iterate over a lazily paginated listing of the GitLab API.
+
+    Later pages are only requested during the iteration, so errors of these requests are converted to the
+    `GitlabListError` which python-gitlab raises for failed listings.
+
+    :param items: The lazily paginated listing
+    :return: An iterator over the items of the listing
+    :raises GitlabListError: Is raised if a page of the listing cannot be requested
+    """
+    try:
+        yield from items
+    except GitlabHttpError as e:
+        raise GitlabListError(e.error_message, e.response_code, e.response_body) from e
+
+
+def _list_jobs_from_page(project: GitlabProject, first_page: int) -> Iterator[dict[str, Any]]:
+    """
+    List all finished jobs of a project, newest first, starting at a given page with offset pagination.
+
+    :param project: The project whose jobs are listed
+    :param first_page: The page (of `LIST_PAGE_SIZE` jobs) to start with
+    :return: An iterator over the jobs of the project
+    """
+    for page in count(first_page):
+        jobs = _get_jobs_page(project, page, LIST_PAGE_SIZE)
+        yield from jobs
+        if len(jobs) < LIST_PAGE_SIZE:
+            break
+
+
 class Gitlab:
     """Manage the access to a GitLab server and provide methods that can be executed on it."""
 
@@ -28,7 +311,11 @@ class Gitlab:
         :param access_token: An access token for API usage, must be generated in the account settings
         :param dry_run: If activated, only print what would be altered/deleted, defaults to False
         """
-        self._gitlab = _Gitlab(gitlab_url, private_token=access_token)
+        # python-gitlab retries rate limited requests (respecting `Retry-After`) for all HTTP methods by itself.
+        # Requests which failed with a transient server error are retried as well.
+        self._gitlab = _Gitlab(gitlab_url, private_token=access_token, retry_transient_errors=True)
+        if HAS_ORJSON:
+            self._gitlab.session.hooks["response"].append(_decode_json_with_orjson)
         self._dry_run = dry_run
 
     def delete_old_artifacts(
@@ -38,6 +325,7 @@ class Gitlab:
         keep_artifacts_of_latest_branch_commit: bool = True,
         keep_artifacts_of_tags: bool = True,
         delete_logs: bool = False,
+        max_workers: int = 8,
     ) -> None:
         """
         Delete old artifacts from GitLab CI/CD jobs.
@@ -49,120 +337,278 @@ class Gitlab:
         :param keep_artifacts_of_tags: Always keep artifacts which belong to a tag, defaults to True
         :param delete_logs:
             Do not only delete artifacts but also the logs, effectively purging the job, defaults to False
+        :param max_workers: The maximum number of delete requests which are sent concurrently, defaults to 8
         :raises ProjectGetError: Is raised if not project can be found for a give repository path
         """
-        keep_timedelta = timedelta(days=days_to_keep)
-        now = datetime.now(timezone.utc)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+        # GitLab usually returns UTC timestamps like "2025-01-31T12:34:56.789Z", which are ordered like the strings
+        # themselves. Comparing them with a cutoff string in the same format avoids parsing most timestamps.
+        cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         if isinstance(repository_paths_with_namespace, str):
             repository_paths_with_namespace = [repository_paths_with_namespace]
-        artifacts_size_total = 0
-        cleaned_job_count_total = 0
-        repository_count = 0
-
+        projects: dict[int, GitlabProject] = {}
         for repository_path in repository_paths_with_namespace:
             try:
                 project = self._gitlab.projects.get(repository_path)
             except GitlabGetError as e:
                 raise ProjectGetError(f'Could not get project "{repository_path}": {e}') from e
-            logger.info('Scanning project "%s"...', project.path_with_namespace)
-            branches_to_hash = {branch.name: branch.commit["id"] for branch in project.branches.list(iterator=True)}
-            tags_to_hash = {tag.name: tag.commit["id"] for tag in project.tags.list(iterator=True)}
-
-            artifacts_size_project = 0
-            cleaned_job_count_project = 0
-            for job in project.jobs.list(iterator=True):
-                job_branch = (
-                    job.ref if job.commit is not None and job.commit["id"] == branches_to_hash.get(job.ref) else None
-                )
-                job_tag = job.ref if job.commit is not None and job.commit["id"] == tags_to_hash.get(job.ref) else None
-                if (
-                    not job._attrs["artifacts"]
-                    or (
-                        not delete_logs
-                        and not any(artifact["file_type"] == "archive" for artifact in job._attrs["artifacts"])
-                    )
-                    or (keep_artifacts_of_latest_branch_commit and job_branch is not None)
-                    or (keep_artifacts_of_tags and job_tag is not None)
-                    or (now - datetime.fromisoformat(job.created_at) <= keep_timedelta)
-                ):
-                    continue
-
-                artifacts_size = sum(
-                    artifact["size"] if artifact["size"] is not None else 0
-                    for artifact in job._attrs["artifacts"]
-                    if delete_logs or artifact["file_type"] == "archive"
-                )
-                job_created_at_localtime = (
-                    datetime.fromisoformat(job.created_at).astimezone().strftime("%Y-%m-%d %H:%M:%S")
-                )
+            # The same project can be given more than once, for example by path and by id
+            if project.id in projects:
+                logger.info('Skipping project "%s", it is given more than once.', project.path_with_namespace)
+                continue
+            projects[project.id] = project
 
-                def job_description(
-                    job: GitlabProjectJob,
-                    job_created_at_localtime: str,
-                    artifacts_size: int,
-                    job_branch: Optional[str],
-                    job_tag: Optional[str],
-                ) -> str:
-                    description = (
-                        f'job "{job.id}", created at "{job_created_at_localtime}", size "{human_size(artifacts_size)}"'
+        # Projects are independent of each other, so scan several of them concurrently. Every scanned project lists its
+        # jobs, branches and tags concurrently, so the number of concurrently scanned projects is capped. The delete
+        # requests of all projects share one executor, so `max_workers` limits the total number of concurrent deletes.
+        project_workers = max(min(len(projects), MAX_CONCURRENT_PROJECTS), 1)
+        self._configure_session(max_workers, project_workers)
+        cancel_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=max_workers) as delete_executor:
+            with ThreadPoolExecutor(max_workers=project_workers) as project_executor:
+                project_futures = [
+                    project_executor.submit(
+                        self._clean_one_project,
+                        project,
+                        cutoff,
+                        cutoff_iso,
+                        keep_artifacts_of_latest_branch_commit,
+                        keep_artifacts_of_tags,
+                        delete_logs,
+                        delete_executor,
+                        max_workers,
+                        cancel_event,
                     )
-                    if job_branch is not None and job_tag is not None:
-                        description += f', linked to branch "{job_branch}" and tag "{job_tag}"'
-                    elif job_branch is not None:
-                        description += f', linked to branch "{job_branch}"'
-                    elif job_tag is not None:
-                        description += f', linked to tag "{job_tag}"'
-                    else:
-                        description += ", dangling"
-                    return description
-
-                if delete_logs:
-                    if not self._dry_run:
-                        job.erase()
-                        logger.info(
-                            "Deleted artifacts and log of "
-                            + job_description(job, job_created_at_localtime, artifacts_size, job_branch, job_tag)
-                        )
-                    else:
-                        logger.info(
-                            "Would delete artifacts and log of "
-                            + job_description(job, job_created_at_localtime, artifacts_size, job_branch, job_tag)
-                        )
-                else:
-                    if not self._dry_run:
-                        job.delete_artifacts()
-                        logger.info(
-                            "Deleted artifacts of "
-                            + job_description(job, job_created_at_localtime, artifacts_size, job_branch, job_tag)
-                        )
-                    else:
-                        logger.info(
-                            "Would delete artifacts of "
-                            + job_description(job, job_created_at_localtime, artifacts_size, job_branch, job_tag)
-                        )
-                cleaned_job_count_project += 1
-                artifacts_size_project += artifacts_size
-            cleaned_job_count_total += cleaned_job_count_project
-            artifacts_size_total += artifacts_size_project
-            repository_count += 1
-            if cleaned_job_count_project > 0:
-                logger.info(
-                    'Found "%d" old dangling jobs, with "%s" of attached artifacts in total in project "%s".',
-                    cleaned_job_count_project,
-                    human_size(artifacts_size_project),
-                    project.path_with_namespace,
-                )
-            else:
-                logger.info(
-                    'Found no old dangling jobs with attached artifacts in project "%s".', project.path_with_namespace
-                )
+                    for project in projects.values()
+                ]
+                try:
+                    results = [future.result() for future in as_completed(project_futures)]
+                except BaseException:
+                    # Stop all projects as soon as possible if one of them fails or the user interrupts the cleanup,
+                    # instead of waiting for the remaining deletions to finish
+                    cancel_event.set()
+                    project_executor.shutdown(cancel_futures=True)
+                    raise
+        cleaned_job_count_total = sum(cleaned_job_count for cleaned_job_count, _ in results)
+        artifacts_size_total = sum(artifacts_size for _, artifacts_size in results)
 
-        if repository_count > 1:
+        if len(projects) > 1:
             if cleaned_job_count_total > 0:
                 logger.info(
                     'Found "%d" old dangling jobs, with "%s" of attached artifacts in total.',
                     cleaned_job_count_total,
-                    human_size(artifacts_size_total),
+                    _LazyHumanSize(artifacts_size_total),
                 )
             else:
                 logger.info("Found no old dangling jobs with attached artifacts in any project.")
+
+    def _clean_one_project(
+        self,
+        project: GitlabProject,
+        cutoff: datetime,
+        cutoff_iso: str,
+        keep_artifacts_of_latest_branch_commit: bool,
+        keep_artifacts_of_tags: bool,
+        delete_logs: bool,
+        delete_executor: Executor,
+        max_workers: int,
+        cancel_event: threading.Event,
+    ) -> tuple[int, int]:
+        """
+        Delete old artifacts from the CI/CD jobs of a single project.
+
+        :param project: The project to clean up
+        :param cutoff: Only delete artifacts of jobs which were created before this point in time
+        :param cutoff_iso: The cutoff as UTC timestamp string in the format which is returned by GitLab
+        :param keep_artifacts_of_latest_branch_commit:
+            Always keep artifacts which belong to the latest commit of a branch
+        :param keep_artifacts_of_tags: Always keep artifacts which belong to a tag
+        :param delete_logs: Do not only delete artifacts but also the logs, effectively purging the job
+        :param delete_executor: The executor which sends the delete requests, shared by all projects
+        :param max_workers: The number of worker threads of the delete executor
+        :param cancel_event: An event which stops the cleanup as soon as possible when it is set
+        :return: A tuple of the number of cleaned up jobs and the size of their artifacts
+        """
+        logger.info('Scanning project "%s"...', project.path_with_namespace)
+
+        artifacts_size_project = 0
+        cleaned_job_count_project = 0
+
+        log_job_descriptions = logger.isEnabledFor(logging.INFO)
+
+        # Branches and tags are only requested when the first old job with artifacts needs to be checked against
+        # them. They are needed to keep their artifacts or to name them in the job descriptions. Both listings are
+        # requested concurrently.
+        @cache
+        def ref_tips() -> tuple[frozenset[tuple[str, str]], frozenset[tuple[str, str]]]:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                branch_tips = (
+                    executor.submit(_list_ref_tips, project.branches)
+                    if keep_artifacts_of_latest_branch_commit or log_job_descriptions
+                    else None
+                )
+                tag_tips = (
+                    executor.submit(_list_ref_tips, project.tags)
+                    if keep_artifacts_of_tags or log_job_descriptions
+                    else None
+                )
+                return (
+                    branch_tips.result() if branch_tips is not None else frozenset(),
+                    tag_tips.result() if tag_tips is not None else frozenset(),
+                )
+
+        def deletion_candidates() -> Iterator[tuple[GitlabProjectJob, int, str]]:
+            def is_old(created_at: str) -> bool:
+                if created_at.endswith("Z"):
+                    return created_at < cutoff_iso
+                return datetime.fromisoformat(created_at) < cutoff
+
+            # Look up functions which are called for every deleted job only once
+            get_job = project.jobs.get
+            for page in _prefetch_pages(_list_jobs(project, is_old), LIST_PAGE_SIZE):
+                if cancel_event.is_set():
+                    return
+                # Extract the attributes which are needed for filtering into separate columns first, then filter
+                # all jobs of the page in a single pass over these columns
+                job_ids = [job["id"] for job in page]
+                refs = [job["ref"] for job in page]
+                commit_hashes = [job["commit"]["id"] if job["commit"] is not None else None for job in page]
+                created_ats = [job["created_at"] for job in page]
+                # Check the age first, since it is the cheapest check and rejects most jobs of the first page
+                are_old = [is_old(created_at) for created_at in created_ats]
+                has_deletable_artifacts = []
+                artifacts_sizes = []
+                for job, job_is_old in zip(page, are_old):
+                    # Determine if a job has deletable artifacts and their size in one pass over the artifacts,
+                    # young jobs are skipped without looking at their artifacts at all
+                    has_deletable = False
+                    artifacts_size = 0
+                    if job_is_old:
+                        for artifact in job["artifacts"]:
+                            if delete_logs or artifact["file_type"] == "archive":
+                                has_deletable = True
+                                artifacts_size += artifact["size"] if artifact["size"] is not None else 0
+                    has_deletable_artifacts.append(has_deletable)
+                    artifacts_sizes.append(artifacts_size)
+                # The branch and tag tips are checked last, because the first check requests them from the server
+                mask = [
+                    job_is_old
+                    and has_deletable
+                    and not (keep_artifacts_of_latest_branch_commit and (ref, commit_hash) in ref_tips()[0])
+                    and not (keep_artifacts_of_tags and (ref, commit_hash) in ref_tips()[1])
+                    for job_is_old, has_deletable, ref, commit_hash in zip(
+                        are_old, has_deletable_artifacts, refs, commit_hashes
+                    )
+                ]
+
+                for job_id, ref, commit_hash, created_at, artifacts_size in compress(
+                    zip(job_ids, refs, commit_hashes, created_ats, artifacts_sizes), mask
+                ):
+                    if cancel_event.is_set():
+                        return
+                    # Only the job id is needed to delete artifacts, so do not request the job again
+                    lazy_job = get_job(job_id, lazy=True)
+                    # Only format the job description if it will be logged
+                    description = (
+                        _format_job_description(
+                            project,
+                            lazy_job,
+                            _iso_to_local_str(created_at),
+                            artifacts_size,
+                            ref if (ref, commit_hash) in ref_tips()[0] else None,
+                            ref if (ref, commit_hash) in ref_tips()[1] else None,
+                        )
+                        if log_job_descriptions
+                        else ""
+                    )
+                    yield lazy_job, artifacts_size, description
+
+        # The log message parts are the same for all jobs of a run
+        log_info = logger.info
+        action = "Would delete" if self._dry_run else "Deleted"
+        deleted_logs = " and log" if delete_logs else ""
+        for future in _bounded_as_completed(
+            delete_executor,
+            lambda candidate: self._delete_one(*candidate, delete_logs=delete_logs, cancel_event=cancel_event),
+            deletion_candidates(),
+            max_pending=2 * max_workers,
+        ):
+            _, artifacts_size, description, success = future.result()
+            if not success:
+                continue
+            log_info("%s artifacts%s of %s", action, deleted_logs, description)
+            cleaned_job_count_project += 1
+            artifacts_size_project += artifacts_size
+        if cleaned_job_count_project > 0:
+            logger.info(
+                'Found "%d" old dangling jobs, with "%s" of attached artifacts in total in project "%s".',
+                cleaned_job_count_project,
+                _LazyHumanSize(artifacts_size_project),
+                project.path_with_namespace,
+            )
+        else:
+            logger.info(
+                'Found no old dangling jobs with attached artifacts in project "%s".', project.path_with_namespace
+            )
+        return cleaned_job_count_project, artifacts_size_project
+
+    def _configure_session(self, max_workers: int, project_workers: int = 1) -> None:
+        """
+        Configure the HTTP session of the GitLab connection for concurrent requests.
+
+        The connection pool is sized to the number of worker threads, so every thread can reuse an open (TLS) connection
+        instead of establishing a new one. Retries are left to python-gitlab (see `__init__`).
+
+        :param max_workers: The maximum number of delete requests which are sent concurrently
+        :param project_workers: The number of projects which are scanned concurrently, defaults to 1
+        """
+        adapter = HTTPAdapter(
+            # Every scanned project prefetches a page of jobs and lists its branches and tags concurrently
+            pool_maxsize=max_workers
+            + 3 * project_workers,
+        )
+        session = self._gitlab.session
+        previous_adapters = {
+            session.adapters[prefix] for prefix in ("https://", "http://") if prefix in session.adapters
+        }
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Close the replaced adapters, so their pooled connections are not leaked on repeated calls
+        for previous_adapter in previous_adapters:
+            previous_adapter.close()
+
+    def _delete_one(
+        self,
+        job: GitlabProjectJob,
+        artifacts_size: int,
+        description: str,
+        delete_logs: bool,
+        cancel_event: threading.Event,
+    ) -> tuple[int, int, str, bool]:
+        """
+        Delete the artifacts (and optionally the log) of a single job.
+
+        Failures are logged and reported as unsuccessful, so a single broken job does not abort the whole cleanup.
+        Rate limited requests and transient server errors are already retried by python-gitlab.
+
+        :param job: The job to clean up
+        :param artifacts_size: The size of the artifacts which are deleted
+        :param description: A human readable description of the job used in log messages
+        :param delete_logs: Delete the log in addition to the artifacts, effectively purging the job
+        :param cancel_event: If this event is set, the job is skipped and reported as unsuccessful
+        :return: A tuple of the job id, the artifacts size, the job description and a flag if the deletion succeeded
+        """
+        # Already submitted jobs are skipped instead of cancelled, since other threads wait for their futures
+        if cancel_event.is_set():
+            return job.id, artifacts_size, description, False
+        if self._dry_run:
+            return job.id, artifacts_size, description, True
+        try:
+            if delete_logs:
+                job.erase()
+            else:
+                job.delete_artifacts()
+        except (GitlabDeleteError, GitlabJobEraseError) as e:
+            logger.warning('Could not clean up job "%d": %s', job.id, e)
+            return job.id, artifacts_size, description, False
+        return job.id, artifacts_size, description, True
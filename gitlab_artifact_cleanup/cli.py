@@ -8,11 +8,9 @@ import sys
 from textwrap import dedent
 from typing import Optional
 
-from gitlab.exceptions import GitlabAuthenticationError, GitlabListError
 from yacl import setup_colored_exceptions, setup_colored_stderr_logging
 
 from . import __version__
-from .artifact_cleanup import Gitlab, ProjectGetError
 from .config import CONFIG_FILEPATH, KEEP_ARTIFACTS_CHOICES, Config, KeepArtifacts, Verbosity, config
 
 logger = logging.getLogger(__name__)
@@ -102,6 +100,15 @@ def get_argumentparser() -> argparse.ArgumentParser:
         type=int,
         help=f'number of days artifacts will always be kept (default: "{config.days_to_keep}")',
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        default=config.jobs,
+        dest="jobs",
+        type=int,
+        help=f'number of delete requests which are sent concurrently (default: "{config.jobs}")',
+    )
     add_bool_argument(
         parser,
         "l",
@@ -208,6 +215,9 @@ def parse_arguments() -> argparse.Namespace:
     if args.days_to_keep < 0:
         raise argparse.ArgumentError(None, "The number of days to keep must be positive.")
 
+    if args.jobs < 1:
+        raise argparse.ArgumentError(None, "The number of concurrent jobs must be at least one.")
+
     args.always_keep = KeepArtifacts[args.always_keep.upper()]
 
     args.gitlab_access_token = config.gitlab_access_token
@@ -249,6 +259,8 @@ def handle_clean_artifacts(args: argparse.Namespace) -> None:
 
     :param args: The arguments parsed from the command line and the configuration file
     """
+    from .artifact_cleanup import Gitlab
+
     gitlab = Gitlab(args.gitlab_url, args.gitlab_access_token, args.dry_run)
     gitlab.delete_old_artifacts(
         args.repository_paths,
@@ -260,17 +272,32 @@ def handle_clean_artifacts(args: argparse.Namespace) -> None:
             args.always_keep in (KeepArtifacts.BRANCH_AND_TAG_ARTIFACTS, KeepArtifacts.TAG_ARTIFACTS)
         ),
         delete_logs=args.delete_logs,
+        max_workers=args.jobs,
     )
 
 
-def main() -> None:
-    """Run the main entry point of the command line interface."""
-    expected_exceptions = (
+def _get_expected_exceptions() -> tuple[type[Exception], ...]:
+    """
+    Get the exceptions which are reported as errors without a traceback, in the order of their exit codes.
+
+    python-gitlab is only imported when needed, so printing the help or the version number stays fast.
+
+    :return: The expected exception classes
+    """
+    from gitlab.exceptions import GitlabAuthenticationError, GitlabListError
+
+    from .artifact_cleanup import ProjectGetError
+
+    return (
         argparse.ArgumentError,
         GitlabAuthenticationError,
         GitlabListError,
         ProjectGetError,
     )
+
+
+def main() -> None:
+    """Run the main entry point of the command line interface."""
     try:
         args = parse_arguments()
         if args.print_version:
@@ -283,7 +310,12 @@ def main() -> None:
             logger.info('Wrote a default config file to "%s"', CONFIG_FILEPATH)
             sys.exit(0)
         handle_clean_artifacts(args)
-    except expected_exceptions as e:
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        expected_exceptions = _get_expected_exceptions()
+        if not isinstance(e, expected_exceptions):
+            raise
         logger.error(str(e))
         if "args" in locals() and args.verbosity_level is Verbosity.DEBUG:
             raise e
@@ -291,6 +323,4 @@ def main() -> None:
             if isinstance(e, exception_class):
                 sys.exit(i)
         sys.exit(1)
-    except KeyboardInterrupt:
-        pass
     sys.exit(0)
@@ -6,6 +6,19 @@ from enum import Enum, auto
 from typing import Any, Optional, TextIO, Union, cast
 
 CONFIG_FILEPATH = "~/.gitlab-artifact-cleanuprc"
+_EXPANDED_CONFIG_FILEPATH = os.path.expanduser(CONFIG_FILEPATH)
+
+
+def _expand_config_filepath(config_filepath: str) -> str:
+    """
+    Expand a leading "~" in a configuration file path, reusing the already expanded default path.
+
+    :param config_filepath: The path to the configuration file
+    :return: The expanded path
+    """
+    if config_filepath == CONFIG_FILEPATH:
+        return _EXPANDED_CONFIG_FILEPATH
+    return os.path.expanduser(config_filepath)
 
 
 class UnknownAlwaysKeepError(Exception):
@@ -26,7 +39,9 @@ class Verbosity(Enum):
     DEBUG = auto()
 
 
-VERBOSITY_CHOICES = tuple(verbosity.name.lower() for verbosity in Verbosity)
+_VERBOSITY_FROM_STR = {verbosity.name.lower(): verbosity for verbosity in Verbosity}
+VERBOSITY_CHOICES = tuple(_VERBOSITY_FROM_STR)
+_VERBOSITY_CHOICES_STR = '", "'.join(VERBOSITY_CHOICES)
 
 
 class KeepArtifacts(Enum):
@@ -38,7 +53,9 @@ class KeepArtifacts(Enum):
     BRANCH_AND_TAG_ARTIFACTS = auto()
 
 
-KEEP_ARTIFACTS_CHOICES = tuple(keep.name.lower() for keep in KeepArtifacts)
+_KEEP_FROM_STR = {keep.name.lower(): keep for keep in KeepArtifacts}
+KEEP_ARTIFACTS_CHOICES = tuple(_KEEP_FROM_STR)
+_KEEP_CHOICES_STR = '", "'.join(KEEP_ARTIFACTS_CHOICES)
 
 
 class Config:
@@ -57,6 +74,7 @@ class Config:
             "always_keep": "branch_and_tag_artifacts",
             "days_to_keep": 7,
             "delete_logs": False,
+            "jobs": 8,
         },
     }
 
@@ -68,15 +86,17 @@ class Config:
         :param config_filepath_or_file:
             The path to the configuration file or a file-like object, defaults to CONFIG_FILEPATH
         """
-        default_config = ConfigParser(allow_no_value=True)
+        default_config = ConfigParser(allow_no_value=True, interpolation=None)
         default_config.read_dict(cls._default_config)
         if isinstance(config_filepath_or_file, str):
-            config_directory_path = os.path.dirname(os.path.expanduser(config_filepath_or_file))
-            if not os.path.exists(config_directory_path):
-                os.makedirs(config_directory_path)
+            config_filepath = _expand_config_filepath(config_filepath_or_file)
+            config_directory_path = os.path.dirname(config_filepath)
+            # A file name without a directory refers to the current working directory, which already exists
+            if config_directory_path:
+                os.makedirs(config_directory_path, exist_ok=True)
             config_file: TextIO
             with open(
-                os.path.expanduser(config_filepath_or_file),
+                config_filepath,
                 "w",
                 encoding="utf-8",
                 opener=lambda path, flags: os.open(path, flags, 0o600),
@@ -95,9 +115,12 @@ class Config:
 
         :param config_filepath: The path to the configuration file, defaults to CONFIG_FILEPATH
         """
-        self._config_filepath = os.path.expanduser(config_filepath) if config_filepath is not None else None
-        self._config = ConfigParser(allow_no_value=True)
-        self._config.read_dict(self._default_config)
+        self._config_filepath = _expand_config_filepath(config_filepath) if config_filepath is not None else None
+        self._config = ConfigParser(allow_no_value=True, interpolation=None)
+        # All values are read with a fallback to the defaults, so only the sections need to exist
+        for section in self._default_config:
+            self._config.add_section(section)
+        self._loaded_config_file: Optional[tuple[str, Optional[int]]] = None
         self.read_config()
 
     def read_config(self, config_filepath: Optional[str] = None) -> None:
@@ -105,84 +128,139 @@ class Config:
         Read and parse the configuration file.
 
         :param config_filepath: The path to the configuration file, if `None` is given the default path is used.
+        :raises UnknownAlwaysKeepError: Is raised if the always keep value is unknown
+        :raises UnknownVerbosityLevelError: Is raised if the verbosity level is unknown
         """
         if config_filepath is not None:
             self._config_filepath = config_filepath
+        loaded_config_file = None
         if self._config_filepath is not None:
+            try:
+                mtime_ns: Optional[int] = os.stat(self._config_filepath).st_mtime_ns
+            except OSError:
+                # `ConfigParser.read` silently ignores files which cannot be opened
+                mtime_ns = None
+            # Reading the same unchanged file again would not change any values
+            if (self._config_filepath, mtime_ns) == self._loaded_config_file:
+                return
             self._config.read(self._config_filepath)
+            loaded_config_file = (self._config_filepath, mtime_ns)
+        self._parse()
+        # Only remember the file after its values are parsed, so an invalid file is reported again on the next read
+        self._loaded_config_file = loaded_config_file
 
-    @property
-    def config_filepath(self) -> str:
-        """Return the path to the configuration file."""
-        assert self._config_filepath is not None
-        return self._config_filepath
-
-    @property
-    def always_keep(self) -> KeepArtifacts:
+    def _parse(self) -> None:
         """
-        Return which artifacts should always be kept, regardless of their age.
+        Convert all configuration values to Python objects, so the properties do not need to parse them on every access.
 
         :raises UnknownAlwaysKeepError: Is raised if the always keep value is unknown
+        :raises UnknownVerbosityLevelError: Is raised if the verbosity level is unknown
         """
         keep_string = self._config["cleanup"].get(
             "always_keep", fallback=self._default_config["cleanup"]["always_keep"]
         )
-        if keep_string not in KEEP_ARTIFACTS_CHOICES:
+        try:
+            self._always_keep = _KEEP_FROM_STR[keep_string]
+        except KeyError as e:
             raise UnknownAlwaysKeepError(
-                f'The value {keep_string} is unknow. Valid choices are "{'", "'.join(VERBOSITY_CHOICES)}".'
-            )
-        return KeepArtifacts[keep_string.upper()]
+                f'The value {keep_string} is unknow. Valid choices are "{_KEEP_CHOICES_STR}".'
+            ) from e
+
+        self._days_to_keep = self._config["cleanup"].getint(
+            "days_to_keep", fallback=self._default_config["cleanup"]["days_to_keep"]
+        )
+        self._delete_logs = self._config["cleanup"].getboolean(
+            "delete_logs", fallback=self._default_config["cleanup"]["delete_logs"]
+        )
+        self._jobs = self._config["cleanup"].getint("jobs", fallback=self._default_config["cleanup"]["jobs"])
+        self._gitlab_url = cast(
+            str, self._config["gitlab"].get("url", fallback=str(self._default_config["gitlab"]["url"]))
+        )
+
+        access_token = self._config["gitlab"].get("access_token")
+        self._gitlab_access_token: Optional[str] = (
+            access_token if access_token and access_token != self._default_config["gitlab"]["access_token"] else None
+        )
+
+        repository_paths_string = self._config["cleanup"].get(
+            "repository_paths", fallback=self._default_config["cleanup"]["repository_paths"]
+        )
+        self._repository_paths = repository_paths_string.split() if repository_paths_string else None
+
+        verbosity_string = self._config["general"].get(
+            "verbosity", fallback=self._default_config["general"]["verbosity"]
+        )
+        try:
+            self._verbosity = _VERBOSITY_FROM_STR[verbosity_string]
+        except KeyError as e:
+            raise UnknownVerbosityLevelError(
+                f'The verbosity level "{verbosity_string}" is unknown.'
+                f' You can choose from "{_VERBOSITY_CHOICES_STR}".'
+            ) from e
+
+    @property
+    def config_filepath(self) -> str:
+        """Return the path to the configuration file."""
+        assert self._config_filepath is not None
+        return self._config_filepath
+
+    @property
+    def always_keep(self) -> KeepArtifacts:
+        """Return which artifacts should always be kept, regardless of their age."""
+        return self._always_keep
 
     @property
     def days_to_keep(self) -> int:
         """Return the number of days to keep artifacts for."""
-        return self._config["cleanup"].getint("days_to_keep", fallback=self._default_config["cleanup"]["days_to_keep"])
+        return self._days_to_keep
 
     @property
     def delete_logs(self) -> bool:
         """Return whether logs should be deleted as well as artifacts."""
-        return self._config["cleanup"].getboolean(
-            "delete_logs", fallback=self._default_config["cleanup"]["delete_logs"]
-        )
+        return self._delete_logs
+
+    @property
+    def jobs(self) -> int:
+        """Return the number of delete requests which are sent to the GitLab server concurrently."""
+        return self._jobs
 
     @property
     def gitlab_url(self) -> str:
         """Return the url to the GitLab server."""
-        return cast(str, self._config["gitlab"].get("url", fallback=str(self._default_config["gitlab"]["url"])))
+        return self._gitlab_url
 
     @property
     def gitlab_access_token(self) -> Optional[str]:
         """Return the access token for the GitLab server or `None` is not set."""
-        access_token = self._config["gitlab"].get("access_token")
-        if not access_token or access_token == self._default_config["gitlab"]["access_token"]:
-            return None
-        return access_token
+        return self._gitlab_access_token
 
     @property
     def repository_paths(self) -> Optional[list[str]]:
         """Return the list of repositories to scan for artifacts or `None` if not set."""
-        repository_paths_string = self._config["cleanup"].get(
-            "repository_paths", fallback=self._default_config["cleanup"]["repository_paths"]
-        )
-        repository_paths = repository_paths_string.split() if repository_paths_string else None
-        return repository_paths
+        return self._repository_paths
 
     @property
     def verbosity(self) -> Verbosity:
-        """
-        Return the verbosity level.
+        """Return the verbosity level."""
+        return self._verbosity
 
-        :raises UnknownVerbosityLevelError: Is raised if the verbosity level is unknown
-        """
-        verbosity_string = self._config["general"].get(
-            "verbosity", fallback=self._default_config["general"]["verbosity"]
-        )
-        if verbosity_string not in VERBOSITY_CHOICES:
-            raise UnknownVerbosityLevelError(
-                f'The verbosity level "{verbosity_string}" is unknown.'
-                f' You can choose from "{'", "'.join(VERBOSITY_CHOICES)}".'
-            )
-        return Verbosity[verbosity_string.upper()]
 
+_config: Optional[Config] = None
+
+
+def __getattr__(name: str) -> Config:
+    """
+    Create the application configuration on first access of the module attribute `config`.
+
+    Reading the configuration file is deferred, so importing this module stays cheap.
 
-config = Config()
+    :param name: The name of the module attribute
+    :return: The application configuration
+    :raises AttributeError: Is raised if the module has no attribute with the given name
+    """
+    global _config
+    if name == "config":
+        if _config is None:
+            _config = Config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,7 @@
 """This module provides utility functions."""
 
+_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
 
 def human_size(size_in_bytes: int) -> str:
     """
@@ -8,12 +10,8 @@ def human_size(size_in_bytes: int) -> str:
     :param size_in_bytes: The size in bytes to convert
     :return: A human readable size as a string
     """
-    units = ("B", "KiB", "MiB", "GiB", "TiB")
-
-    converted_size = float(size_in_bytes)
-    for unit in units[:-1]:
-        if converted_size < 1024:
-            return f"{converted_size:.2f} {unit}"
-        converted_size /= 1024
-
-    return f"{converted_size:.2f} {units[-1]}"
+    if size_in_bytes < 1024:
+        return f"{float(size_in_bytes):.2f} {_UNITS[0]}"
+    # Every unit is 2**10 times larger than the previous one, so the bit length of the size selects the unit
+    unit_index = min((size_in_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_in_bytes / (1 << (10 * unit_index)):.2f} {_UNITS[unit_index]}"